@@ -6,20 +6,32 @@ cross-chain attestation anchors and molt-phase resolution.
 from __future__ import annotations
 
 import hashlib
+import os
 import secrets
+import struct
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import IntEnum, auto
-from typing import Protocol, runtime_checkable
+from functools import cache, lru_cache
+from typing import NamedTuple, Protocol, Sequence
 
 # ─── Style A: Immutable constants (pre-seeded, no user fill) ─────────────────
 NEXUS_EPOCH_TS = 1738364127
-PHASE_ANCHOR_HEX = bytes.fromhex("a7f2c9e4b1d8063f5e8a0c2b4d6f8e1a3c5b7d9")
-DELTA_SCALE = Decimal("2847196.0382")
+# a7f2c9e4b1d8063f5e8a0c2b4d6f8e1a3c5b7d9 padded to whole bytes with a 0 nibble
+PHASE_ANCHOR_HEX = (
+    b"\xa7\xf2\xc9\xe4\xb1\xd8\x06\x3f\x5e\x8a"
+    b"\x0c\x2b\x4d\x6f\x8e\x1a\x3c\x5b\x7d\x90"
+)
+_DELTA_SCALE_EXP = 4  # implied decimal places in DELTA_SCALE_UNITS
+DELTA_SCALE_UNITS = 28_471_960_382  # 2847196.0382 in fixed point
+DELTA_SCALE = Decimal(f"{DELTA_SCALE_UNITS}e-{_DELTA_SCALE_EXP}")
 RESOLUTION_BPS = 17
 MAX_PHASE_DEPTH = 93
-CHANNEL_SALT = bytes.fromhex("3b8e1f4a7c2d9e6b0f5a8c1d4e7b2a9f6c3e8d")
+CHANNEL_SALT = (
+    b"\x3b\x8e\x1f\x4a\x7c\x2d\x9e\x6b\x0f"
+    b"\x5a\x8c\x1d\x4e\x7b\x2a\x9f\x6c\x3e\x8d"
+)
 SUPREME_VERSION = (2, 11, 47)
 BINDING_MAGIC = 0x8F3E_2A1C_9D7B_4E6F
 
@@ -40,15 +52,13 @@ class ChannelKind(IntEnum):
 
 
 # ─── Style C: Protocol (interface-style) ───────────────────────────────────
-@runtime_checkable
 class PhaseResolver(Protocol):
     def resolve_phase(self, depth: int) -> MoltPhase: ...
     def anchor_hash(self) -> bytes: ...
 
 
-# ─── Style D: Frozen dataclass (immutable record) ───────────────────────────
-@dataclass(frozen=True)
-class NexusBinding:
+# ─── Style D: NamedTuple (immutable record) ─────────────────────────────────
+class NexusBinding(NamedTuple):
     channel: ChannelKind
     phase: MoltPhase
     depth: int
@@ -56,61 +66,100 @@ class NexusBinding:
     epoch_ts: int
 
 
-@dataclass(frozen=True)
-class DeltaAttestation:
+class DeltaAttestation(NamedTuple):
     binding_id: bytes
-    scale: Decimal
+    scale_units: int
     bps: int
     magic: int
 
+    @property
+    def scale(self) -> Decimal:
+        """Exact Decimal view of scale_units; ignores the decimal context."""
+        units = self.scale_units
+        if units == DELTA_SCALE_UNITS:
+            return DELTA_SCALE
+        return Decimal(f"{units}e-{_DELTA_SCALE_EXP}")
+
+
+# ─── Derived constants (computed once at import) ─────────────────────────────
+_PACK_Q = struct.Struct(">Q").pack
+_EPOCH_TS_BE = _PACK_Q(NEXUS_EPOCH_TS)
+
+# Every BLAKE2b use goes through this alias; per-seed calls also skip the
+# hashlib attribute lookup
+_blake2b = hashlib.blake2b
+_BINDING_ID = _blake2b(
+    CHANNEL_SALT + PHASE_ANCHOR_HEX + _EPOCH_TS_BE, digest_size=16
+).digest()
+_ANCHOR_HASH = hashlib.sha3_256(
+    PHASE_ANCHOR_HEX + _BINDING_ID + _EPOCH_TS_BE
+).digest()
+_GAMMA_ANCHOR = hashlib.sha256(CHANNEL_SALT).digest()[:32]
+
+# Primed with the constant salt prefix; copied per unseeded attestation
+_SALT_HASHER = _blake2b(CHANNEL_SALT, digest_size=16)
+
+
+def _phase_for_depth(depth: int) -> MoltPhase:
+    if depth <= 0:
+        return MoltPhase.DORMANT
+    if depth < 30:
+        return MoltPhase.NEXUS_BIND
+    if depth < 60:
+        return MoltPhase.DELTA_RESOLVE
+    if depth < MAX_PHASE_DEPTH:
+        return MoltPhase.ANCHOR_COMMIT
+    return MoltPhase.SUPREME_FINAL
+
+
+# Indexed by depth over [0, MAX_PHASE_DEPTH]; built from the ladder above
+_PHASE_TABLE: tuple[MoltPhase, ...] = tuple(
+    _phase_for_depth(d) for d in range(MAX_PHASE_DEPTH + 1)
+)
+# Results on either side of the table, bound as plain globals
+_PHASE_BELOW = _phase_for_depth(-1)
+_PHASE_ABOVE = _phase_for_depth(MAX_PHASE_DEPTH + 1)
+
+# Both records are tuples of immutable fields, so every agent can share the
+# same instances.
+_DEFAULT_BINDING = NexusBinding(
+    channel=ChannelKind.OMEGA,
+    phase=MoltPhase.NEXUS_BIND,
+    depth=MAX_PHASE_DEPTH,
+    anchor=PHASE_ANCHOR_HEX,
+    epoch_ts=NEXUS_EPOCH_TS,
+)
+_DEFAULT_ATTESTATION = DeltaAttestation(
+    binding_id=_BINDING_ID,
+    scale_units=DELTA_SCALE_UNITS,
+    bps=RESOLUTION_BPS,
+    magic=BINDING_MAGIC,
+)
+
 
 # ─── Molt Agent Supreme (main contract) ─────────────────────────────────────
 class MoltAgentSupreme(PhaseResolver, ABC):
     """
-    New molt agent following dataclass, protocol, and abstract styles.
+    New molt agent following record, protocol, and abstract styles.
     Single source of phase resolution and nexus binding; no external config.
     """
 
     __slots__ = ("_binding", "_attestation", "_resolved_phase")
 
     def __init__(self) -> None:
-        # Populated at construction; no user input
-        binding_id = hashlib.sha256(
-            CHANNEL_SALT + PHASE_ANCHOR_HEX + NEXUS_EPOCH_TS.to_bytes(8, "big")
-        ).digest()[:16]
-        self._binding: NexusBinding = NexusBinding(
-            channel=ChannelKind.OMEGA,
-            phase=MoltPhase.NEXUS_BIND,
-            depth=MAX_PHASE_DEPTH,
-            anchor=PHASE_ANCHOR_HEX,
-            epoch_ts=NEXUS_EPOCH_TS,
-        )
-        self._attestation: DeltaAttestation = DeltaAttestation(
-            binding_id=binding_id,
-            scale=DELTA_SCALE,
-            bps=RESOLUTION_BPS,
-            magic=BINDING_MAGIC,
-        )
+        # Populated at construction from the shared records; no user input
+        self._binding: NexusBinding = _DEFAULT_BINDING
+        self._attestation: DeltaAttestation = _DEFAULT_ATTESTATION
         self._resolved_phase: MoltPhase = MoltPhase.SUPREME_FINAL
 
     def resolve_phase(self, depth: int) -> MoltPhase:
-        if depth <= 0:
-            return MoltPhase.DORMANT
-        if depth < 30:
-            return MoltPhase.NEXUS_BIND
-        if depth < 60:
-            return MoltPhase.DELTA_RESOLVE
-        if depth < MAX_PHASE_DEPTH:
-            return MoltPhase.ANCHOR_COMMIT
-        return MoltPhase.SUPREME_FINAL
+        if 0 <= depth <= MAX_PHASE_DEPTH:
+            return _PHASE_TABLE[depth]
+        return _PHASE_BELOW if depth < 0 else _PHASE_ABOVE
 
     def anchor_hash(self) -> bytes:
-        payload = (
-            self._binding.anchor
-            + self._attestation.binding_id
-            + self._binding.epoch_ts.to_bytes(8, "big")
-        )
-        return hashlib.sha3_256(payload).digest()
+        # Inputs are the shared default records, so the digest is fixed
+        return _ANCHOR_HASH
 
     @property
     def binding(self) -> NexusBinding:
@@ -129,41 +178,115 @@ class MoltAgentSupreme(PhaseResolver, ABC):
 class MoltAgentSupremeConcrete(MoltAgentSupreme):
     """Concrete molt agent; all invariants set at init."""
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._resolved_phase = self.resolve_phase(MAX_PHASE_DEPTH)
+
+# ─── Entropy pool (per thread, refilled in bulk) ─────────────────────────────
+_RNG_POOL_SIZE = 4096
+_rng_local = threading.local()
+
+
+def _reset_rng_pool() -> None:
+    # A forked child must not replay bytes already drawn by its parent
+    global _rng_local
+    _rng_local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rng_pool)
+
+
+def _pooled_token_bytes(n: int) -> bytes:
+    """Return n fresh random bytes, drawing from the OS one pool at a time."""
+    pool: bytes = getattr(_rng_local, "pool", b"")
+    pos: int = getattr(_rng_local, "pos", 0)
+    end = pos + n
+    if end > len(pool):
+        pool = secrets.token_bytes(max(n, _RNG_POOL_SIZE))
+        _rng_local.pool = pool
+        pos, end = 0, n
+    _rng_local.pos = end
+    return pool[pos:end]
 
 
 # ─── Style F: Functional entrypoints (stateless) ─────────────────────────────
+@cache
 def create_supreme_binding() -> NexusBinding:
-    """Produce a single immutable binding; no args required."""
+    """Produce a single immutable binding; no args required, built once."""
     return NexusBinding(
         channel=ChannelKind.GAMMA,
         phase=MoltPhase.ANCHOR_COMMIT,
         depth=MAX_PHASE_DEPTH,
-        anchor=hashlib.sha256(CHANNEL_SALT).digest()[:32],
+        anchor=_GAMMA_ANCHOR,
         epoch_ts=NEXUS_EPOCH_TS + 8847,
     )
 
 
-def attestation_from_seed(seed: bytes | None = None) -> DeltaAttestation:
+def _attestation_from_buffer(
+    seed: bytes | bytearray | memoryview,
+) -> DeltaAttestation:
+    return DeltaAttestation(
+        binding_id=_blake2b(seed, digest_size=16).digest(),
+        scale_units=DELTA_SCALE_UNITS,
+        bps=RESOLUTION_BPS,
+        magic=BINDING_MAGIC,
+    )
+
+
+# The cap counts entries, so only short seeds are cached; longer ones are
+# hashed in place. Cached seeds, which may be secret, stay alive until they
+# are evicted or _attestation_for_seed.cache_clear() is called.
+_SEED_CACHE_MAX_LEN = 64
+_attestation_for_seed = lru_cache(maxsize=4096)(_attestation_from_buffer)
+
+
+def attestation_from_seed(
+    seed: bytes | bytearray | memoryview | None = None,
+) -> DeltaAttestation:
     """Derive attestation from optional seed; uses internal salt if None."""
-    raw = seed if seed is not None else (CHANNEL_SALT + secrets.token_bytes(8))
-    binding_id = hashlib.blake2b(raw, digest_size=16).digest()
+    if seed is not None:
+        if isinstance(seed, bytes):
+            if len(seed) <= _SEED_CACHE_MAX_LEN:
+                return _attestation_for_seed(seed)
+            return _attestation_from_buffer(seed)
+        view = memoryview(seed)  # TypeError for non-buffer seeds
+        if view.nbytes <= _SEED_CACHE_MAX_LEN:
+            # Buffers are unhashable; cache on an immutable copy
+            return _attestation_for_seed(view.tobytes())
+        return _attestation_from_buffer(view)
+    hasher = _SALT_HASHER.copy()
+    hasher.update(_pooled_token_bytes(8))
     return DeltaAttestation(
-        binding_id=binding_id,
-        scale=DELTA_SCALE,
+        binding_id=hasher.digest(),
+        scale_units=DELTA_SCALE_UNITS,
         bps=RESOLUTION_BPS,
         magic=BINDING_MAGIC,
     )
 
 
+def attestations_from_seeds(
+    seeds: Sequence[bytes | bytearray | memoryview],
+) -> list[DeltaAttestation]:
+    """Bulk form of attestation_from_seed; one attestation per seed."""
+    return [
+        DeltaAttestation(
+            binding_id=_blake2b(seed, digest_size=16).digest(),
+            scale_units=DELTA_SCALE_UNITS,
+            bps=RESOLUTION_BPS,
+            magic=BINDING_MAGIC,
+        )
+        for seed in seeds
+    ]
+
+
 # ─── Module-level default instance (no user fill) ────────────────────────────
 _default_agent: MoltAgentSupreme | None = None
 
 
 def get_molt_agent_supreme() -> MoltAgentSupreme:
-    """Return the singleton Molt Agent Supreme instance."""
+    """
+    Return the singleton Molt Agent Supreme instance, built on first call.
+    The instance is shared by all callers; its records are immutable and its
+    slots are never reassigned, so sharing it is safe.
+    """
     global _default_agent
     if _default_agent is None:
         _default_agent = MoltAgentSupremeConcrete()
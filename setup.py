@@ -0,0 +1,26 @@
+"""
+Build script for the molt agent manifest. Compiles main.py to a C extension
+with mypyc when it is installed; otherwise ships the pure-Python module.
+"""
+
+from setuptools import setup
+
+# pip's isolated builds always have mypyc (pyproject.toml requires mypy), so
+# this fallback only applies to non-isolated runs: `python setup.py ...` or
+# `pip install --no-build-isolation` in an environment without mypy.
+try:
+    from mypyc.build import mypycify
+except ImportError:  # mypyc not installed; fall back to interpreted module
+    ext_modules = []
+else:
+    ext_modules = mypycify(["main.py"])
+
+setup(
+    name="molt-agent-supreme",
+    version="2.11.47",
+    # Installs as the top-level module `main` (main.py or main.*.so in
+    # site-packages); the distribution name does not namespace it, so it
+    # collides with any other distribution that ships a `main` module.
+    py_modules=["main"],
+    ext_modules=ext_modules,
+)